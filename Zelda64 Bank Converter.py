@@ -9,7 +9,11 @@ import argparse
 import datetime
 from typing import Final
 from dataclasses import dataclass, field
-import xml.etree.ElementTree as xml
+try:
+  # lxml's C-backed parser is a drop-in for the ElementTree API used here and is much faster on large banks
+  from lxml import etree as xml
+except ImportError:
+  import xml.etree.ElementTree as xml
 
 
 # Ensure /utils is present and can be imported
@@ -243,12 +247,6 @@ def read_binary(filename: str) -> bytearray:
         binary = bytearray(file.read())
     return binary
 
-def get_nested_attr(obj, attr_chain):
-    for attr in attr_chain.split('.'):
-        obj = getattr(obj, attr)
-    return obj
-
-
 def main() -> None:
     args = parse_args()
     files = args.files
@@ -25,11 +25,17 @@ Intended Usage:
 import struct as _struct
 
 ''' Helper Functions '''
+# Cached string forms for every uint8 value, shared by the to_dict exporters
+STR_U8: tuple = tuple(map(str, range(256)))
+
 def align_to_16(data: int) -> int:
     return (data + 0x0F) & ~0x0F # or (size + 0xF) // 0x10 * 0x10
 
 def add_padding_to_16(packed_data: bytearray) -> bytearray:
     padding: int = (-len(packed_data)) & 0x0F # or (0x10 - (size % 0x10)) % 0x10
+    if padding == 0:
+        return packed_data # Already aligned, skip the padding copy
+
     return packed_data + b'\x00' * padding
 
 # Needed for sample names
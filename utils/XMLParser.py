@@ -47,7 +47,18 @@ Intended Usage:
 '''
 
 
-import xml.etree.ElementTree as xml
+try:
+    # lxml's C-backed parser is a drop-in for the ElementTree API used here and is much faster on large banks
+    from lxml import etree as xml
+except ImportError:
+    import xml.etree.ElementTree as xml
+
+
+_ABINDEXENTRY_KEYS = (
+    "address", "size", "medium", "cache_load_type",
+    "table_id_1", "table_id_2",
+    "num_instruments", "num_drums", "num_effects"
+)
 
 
 def parse_abindexentry(element):
@@ -55,21 +66,12 @@ def parse_abindexentry(element):
     if struct_elem is None:
         return {}
 
-    fields = struct_elem.findall("field")
-    if len(fields) != 9:
+    # findall keeps comment nodes out of the iteration, which lxml preserves when parsing
+    values = [int(field.get("value")) for field in struct_elem.findall("field")]
+    if len(values) != 9:
         raise ValueError() # Metadata requires exactly 9 fields
 
-    return {
-        "address": int(fields[0].attrib["value"]),
-        "size": int(fields[1].attrib["value"]),
-        "medium": int(fields[2].attrib["value"]),
-        "cache_load_type": int(fields[3].attrib["value"]),
-        "table_id_1": int(fields[4].attrib["value"]),
-        "table_id_2": int(fields[5].attrib["value"]),
-        "num_instruments": int(fields[6].attrib["value"]),
-        "num_drums": int(fields[7].attrib["value"]),
-        "num_effects": int(fields[8].attrib["value"])
-    }
+    return dict(zip(_ABINDEXENTRY_KEYS, values))
 
 
 def parse_abbank(element):
@@ -79,12 +81,12 @@ def parse_abbank(element):
 
     fields = struct_elem.findall("field")
 
-    drum_pointer = int(fields[0].attrib["value"])
-    sfx_pointer = int(fields[1].attrib["value"])
+    drum_pointer = int(fields[0].get("value"))
+    sfx_pointer = int(fields[1].get("value"))
 
     instrument_elements = fields[2].findall("element")
 
-    instrument_list = [{"index": int(elem.attrib.get("index", -1))} for elem in instrument_elements]
+    instrument_list = [{"index": int(elem.get("index", -1))} for elem in instrument_elements]
 
     return {
         "drum_pointer": drum_pointer,
@@ -100,7 +102,7 @@ def parse_drumlist(drumlist_elem):
     drumlist = []
 
     for elem in fields[0].findall("element"):
-        drumlist.append({"index": int(elem.attrib.get("index", -1))})
+        drumlist.append({"index": int(elem.get("index", -1))})
 
     return drumlist
 
@@ -112,8 +114,8 @@ def parse_sfxlist(sfxlist_elem):
         struct_elem = elem.find("struct")
         fields = struct_elem.findall("field")
 
-        sample_index = int(fields[0].attrib.get("index", -1))
-        tuning = float(fields[1].attrib["value"])
+        sample_index = int(fields[0].get("index", -1))
+        tuning = float(fields[1].get("value"))
 
         if sample_index == -1 and tuning != 0.0:
             raise ValueError()
@@ -131,11 +133,11 @@ def parse_instrument(item_elem):
     fields = struct_elem.findall("field")
 
     instrument = {
-        "is_relocated": int(fields[0].attrib["value"]),
-        "key_region_low": int(fields[1].attrib["value"]),
-        "key_region_high": int(fields[2].attrib["value"]),
-        "decay_index": int(fields[3].attrib["value"]),
-        "envelope": int(fields[4].attrib.get('index', -1)),
+        "is_relocated": int(fields[0].get("value")),
+        "key_region_low": int(fields[1].get("value")),
+        "key_region_high": int(fields[2].get("value")),
+        "decay_index": int(fields[3].get("value")),
+        "envelope": int(fields[4].get('index', -1)),
         "samples": []
     }
 
@@ -144,8 +146,8 @@ def parse_instrument(item_elem):
         sound_struct = sample.find("struct")
         sound_fields = sound_struct.findall("field")
 
-        sample_index = int(sound_fields[0].attrib["index"]) if "index" in sound_fields[0].attrib else -1
-        tuning = float(sound_fields[1].attrib["value"])
+        sample_index = int(sound_fields[0].get("index", -1))
+        tuning = float(sound_fields[1].get("value"))
 
         if sample_index == -1 and tuning != 0.0:
             raise ValueError()
@@ -169,24 +171,24 @@ def parse_drum(item_elem):
     if len(fields) != 6:
         raise ValueError() # ROM Description is outdated
 
-    assert int(fields[3].attrib["value"]) == 0, "" # Padding byte is always 0
+    assert int(fields[3].get("value")) == 0, "" # Padding byte is always 0
 
-    sample_index = int(sound_fields[0].attrib["index"]) if "index" in sound_fields[0].attrib else -1
-    tuning = float(sound_fields[1].attrib["value"])
+    sample_index = int(sound_fields[0].get("index", -1))
+    tuning = float(sound_fields[1].get("value"))
 
     if sample_index == -1 and tuning != 0.0:
         raise ValueError() # nullptr sample tuning values should be 0.0
 
     drum = {
-        "decay_index": int(fields[0].attrib["value"]),
-        "pan": int(fields[1].attrib["value"]),
-        "is_relocated": int(fields[2].attrib["value"]),
+        "decay_index": int(fields[0].get("value")),
+        "pan": int(fields[1].get("value")),
+        "is_relocated": int(fields[2].get("value")),
         "padding": 0,
         "sample": {
             "sample": sample_index,
             "tuning": tuning
         },
-        "envelope": int(fields[5].attrib.get('index', -1))
+        "envelope": int(fields[5].get('index', -1))
     }
 
     return drum
@@ -201,8 +203,8 @@ def parse_envelope(item_elem):
 
     points = []
     for i in range(0, len(fields), 2):
-        delay = int(fields[i].attrib["value"])
-        arg = int(fields[i + 1].attrib["value"])
+        delay = int(fields[i].get("value"))
+        arg = int(fields[i + 1].get("value"))
         points.append({"delay": delay, "arg": arg})
 
     return {"points": points}
@@ -215,17 +217,17 @@ def parse_sample(item_elem):
     if len(fields) != 4:
         raise ValueError() # ROM Description is outdated
 
-    bitfield = int(fields[0].attrib["value"])
+    bitfield = int(fields[0].get("value"))
 
     unk_0        = (bitfield >> 31) & 0b1
     codec        = (bitfield >> 28) & 0b111
-    medium       = (bitfield >> 26) & 0xb11
+    medium       = (bitfield >> 26) & 0b11
     is_cached    = (bitfield >> 25) & 1
     is_relocated = (bitfield >> 24) & 1
-    size         = (bitfield >> 0) & 0b111111111111111111111111
+    size         = bitfield & 0xFFFFFF
 
-    loop_index = int(fields[2].attrib["index"]) if "index" in fields[2].attrib else -1
-    book_index = int(fields[3].attrib["index"]) if "index" in fields[2].attrib else -1
+    loop_index = int(fields[2].get("index", -1))
+    book_index = int(fields[3].get("index", -1))
 
     assert loop_index  != -1
     assert book_index  != -1
@@ -240,7 +242,7 @@ def parse_sample(item_elem):
         "is_cached": is_cached,
         "is_relocated": is_relocated,
         "size": size,
-        "sample_pointer": int(fields[1].attrib["value"]),
+        "sample_pointer": int(fields[1].get("value")),
         "loop": loop_index,
         "book": book_index
     }
@@ -248,27 +250,32 @@ def parse_sample(item_elem):
     return sample
 
 
+def _parse_predictor_values(data_field) -> list:
+    ''' Reads the 16 int16 coefficients of a predictor data field '''
+    values = [int(el.get("value")) for el in data_field.findall("element")]
+
+    if len(values) != 16:
+        raise ValueError() # Not enough predictor coefficients
+
+    return values
+
+
 def parse_codebook(item_elem):
     struct_elem = item_elem.find("struct")
     fields = struct_elem.findall("field")
 
-    order = int(fields[0].attrib["value"])
-    num_predictors = int(fields[1].attrib["value"])
+    order = int(fields[0].get("value"))
+    num_predictors = int(fields[1].get("value"))
 
     predictors_elem = fields[2].findall("element")
 
     if len(predictors_elem) != num_predictors:
         raise ValueError() # Number of arrays is the num_pred value
 
-    predictors = []
-    for array in predictors_elem:
-        data_field = array.find("struct").find("field")
-        data_values = [int(el.attrib["value"]) for el in data_field.findall("element")]
-
-        if len(data_values) != 16:
-            raise ValueError() # Not enough predictor coefficients
-
-        predictors.append(data_values)
+    predictors = [
+        _parse_predictor_values(array.find("struct").find("field"))
+        for array in predictors_elem
+    ]
 
     book = {
         "order": order,
@@ -283,12 +290,12 @@ def parse_loopbook(item_elem):
     struct_elem = item_elem.find("struct")
     fields = struct_elem.findall("field")
 
-    loop_start = int(fields[0].attrib["value"])
-    loop_end = int(fields[1].attrib["value"])
-    loop_count = int(fields[2].attrib["value"])
-    num_samples = int(fields[3].attrib["value"])
+    loop_start = int(fields[0].get("value"))
+    loop_end = int(fields[1].get("value"))
+    loop_count = int(fields[2].get("value"))
+    num_samples = int(fields[3].get("value"))
 
-    has_tail = struct_elem.attrib.get("HAS_TAIL", "0") == "1"
+    has_tail = struct_elem.get("HAS_TAIL", "0") == "1"
     tail_data = None
 
     if has_tail:
@@ -296,11 +303,7 @@ def parse_loopbook(item_elem):
         if predictors_elem is None:
             raise ValueError() # Should have tail data
 
-        data_field = predictors_elem.find("struct").find("field")
-        tail_data = [int(el.attrib["value"]) for el in data_field.findall("element")]
-
-        if len(tail_data) != 16:
-            raise ValueError() # Not enough predictor coefficients
+        tail_data = _parse_predictor_values(predictors_elem.find("struct").find("field"))
 
     return {
         "loop_start": loop_start,
@@ -36,23 +36,65 @@ Intended Usage:
 '''
 
 
+# Import standard library caching and counting
+from functools import lru_cache
+from itertools import count
+
 # Import Audiobank child structures
 from .structs.Instrument import Instrument
 from .structs.Drum import Drum
-from .structs.Effect import SoundEffect
+from .structs.Effect import SoundEffect, absound_element, empty_absound_element
 from .structs.Sample import Sample
 from .structs.Envelope import Envelope
 from .structs.Loopbook import AdpcmLoop
 from .structs.Codebook import AdpcmBook
 
 # Import XML parsing functions and helper functions
-from ..XMLParser import *
+from ..XMLParser import (
+    parse_abindexentry, parse_abbank, parse_drumlist, parse_sfxlist,
+    parse_instrument, parse_drum, parse_envelope,
+    parse_sample, parse_codebook, parse_loopbook
+)
 from ..Helpers import *
 from ..Enums import *
 
 
+# Precompiled bankmeta structure, bank header, and pointer formats
+_BANKMETA_STRUCT = struct.Struct('>6B1H')
+_BANK_HEADER_STRUCT = struct.Struct('>2I')
+_U32 = struct.Struct('>I')
+
+
+@lru_cache(maxsize=None)
+def _pointer_table_struct(count: int) -> struct.Struct:
+    ''' Returns a cached structure for a table of `count` u32 pointers '''
+    return struct.Struct(f'>{count}I')
+
+
+@lru_cache(maxsize=None)
+def _effect_table_struct(count: int) -> struct.Struct:
+    ''' Returns a cached structure for a table of `count` TunedSamples read as u64 words '''
+    return struct.Struct(f'>{count}Q')
+
+
+# XML section names in their output order, each backed by a _build_<section>_xml method
+_XML_SECTIONS = (
+    'abbank', 'abdrumlist', 'absfxlist',
+    'instruments', 'drums', 'envelopes', 'samples',
+    'aladpcmbooks', 'aladpcmloops'
+)
+
+
 class Bankmeta:
     ''' Represents an instrument bank's metadata '''
+    __slots__ = (
+        'address', 'size',
+        'sample_medium', 'cache_load_type',
+        'table_id_1', 'table_id_2',
+        'num_instruments', 'num_drums', 'num_effects',
+        '_attributes'
+    )
+
     def __init__(self):
         self.address         = 0
         self.size            = 0
@@ -64,6 +106,9 @@ class Bankmeta:
         self.num_drums       = 64
         self.num_effects     = 0
 
+        # Cached attributes dict, built on first access since the metadata is read-only after parse
+        self._attributes = None
+
     @classmethod
     def from_bytes(cls, data: bytes):
         self = cls()
@@ -75,13 +120,12 @@ class Bankmeta:
             self.num_instruments,
             self.num_drums,
             self.num_effects
-        ) = struct.unpack('>6B1H', data[:0x08])
+        ) = _BANKMETA_STRUCT.unpack_from(data, 0)
 
         return self
 
     def to_bytes(self) -> bytes:
-        return struct.pack(
-            '>6B1H',
+        return _BANKMETA_STRUCT.pack(
             self.sample_medium,
             self.cache_load_type,
             self.table_id_1,
@@ -115,12 +159,12 @@ class Bankmeta:
             "field": [
                 {"name": "Bank Offset in Audiobank", "datatype": "uint32", "ispointer": "0", "isarray": "0", "meaning": "Ptr Bank (in Audiobank)", "value": str(self.address)},
                 {"name": "Bank Size", "datatype": "uint32", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.size)},
-                {"name": "Sample Medium", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "defaultval": "2", "value": str(self.sample_medium)},
-                {"name": "Cache Load Type", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "defaultval": "2", "value": str(self.cache_load_type)},
-                {"name": "Sample Bank ID 1", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "defaultval": "0", "value": str(self.table_id_1)},
-                {"name": "Sample Bank ID 2", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "defaultval": "255", "value": str(self.table_id_2)},
-                {"name": "NUM_INST", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "NUM_INST", "value": str(self.num_instruments)},
-                {"name": "NUM_DRUM", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "NUM_DRUM", "value": str(self.num_drums)},
+                {"name": "Sample Medium", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "defaultval": "2", "value": STR_U8[self.sample_medium]},
+                {"name": "Cache Load Type", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "defaultval": "2", "value": STR_U8[self.cache_load_type]},
+                {"name": "Sample Bank ID 1", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "defaultval": "0", "value": STR_U8[self.table_id_1]},
+                {"name": "Sample Bank ID 2", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "defaultval": "255", "value": STR_U8[self.table_id_2]},
+                {"name": "NUM_INST", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "NUM_INST", "value": STR_U8[self.num_instruments]},
+                {"name": "NUM_DRUM", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "NUM_DRUM", "value": STR_U8[self.num_drums]},
                 {"name": "NUM_SFX", "datatype": "uint16", "ispointer": "0", "isarray": "0", "meaning": "NUM_SFX", "value": str(self.num_effects)}
             ]
         }
@@ -157,11 +201,23 @@ class Bankmeta:
 
     @property
     def attributes(self):
-        return {'NUM_INST': self.num_instruments, 'NUM_DRUM': self.num_drums, 'NUM_SFX': self.num_effects, 'ATnum': self.table_id_1}
+        if self._attributes is None:
+            self._attributes = {'NUM_INST': self.num_instruments, 'NUM_DRUM': self.num_drums, 'NUM_SFX': self.num_effects, 'ATnum': self.table_id_1}
+        return self._attributes
 
 
 class Audiobank:
     ''' Represents an XML or binary instrument bank '''
+    __slots__ = (
+        'bankmeta', 'bank_xml',
+        'drumlist_offset', 'sfxlist_offset',
+        'drum_offsets', 'effect_offsets', 'instrument_offsets',
+        'instrument_index_map', 'drum_index_map', 'effect_index_map',
+        'drums', 'effects', 'instruments',
+        'envelope_registry', 'sample_registry', 'loopbook_registry', 'codebook_registry',
+        '_offset_fixups', '_xml_cache'
+    )
+
     def __init__(self):
         self.bankmeta = None
         self.bank_xml = None
@@ -185,6 +241,12 @@ class Audiobank:
         self.loopbook_registry = {}
         self.codebook_registry = {}
 
+        # Cached (owner, offset attribute, child) pairs for update_internal_offsets
+        self._offset_fixups = None
+
+        # Cached to_xml result shared by the *_xml properties
+        self._xml_cache = None
+
     @classmethod
     def from_bytes(cls, bankmeta: Bankmeta, data: bytes):
         self = cls()
@@ -194,14 +256,13 @@ class Audiobank:
         self.loopbook_registry = {}
         self.codebook_registry = {}
 
-        self.drumlist_offset, self.sfxlist_offset = struct.unpack('>2I', data[:0x08])
+        # View the bank data without copying so the sub-parsers never slice fresh bytes objects
+        data = memoryview(data)
+
+        self.drumlist_offset, self.sfxlist_offset = _BANK_HEADER_STRUCT.unpack_from(data, 0)
 
-        # Create drums
-        self.drum_offsets = []
-        for i in range(0, bankmeta.num_drums):
-            offset = self.drumlist_offset + (4 * i)
-            drum_offset = int.from_bytes(data[offset:offset + 0x04])
-            self.drum_offsets.append(drum_offset)
+        # Create drums, decoding the whole pointer table in one call
+        self.drum_offsets = list(_pointer_table_struct(bankmeta.num_drums).unpack_from(data, self.drumlist_offset))
 
         self.drums = []
         valid_drum_index = 0
@@ -213,22 +274,19 @@ class Audiobank:
                 self.drums.append(drum)
                 valid_drum_index += 1
 
-        # Create effects
+        # Create effects, reading the whole table as u64 words so empty slots are one integer compare
         self.effects = []
-        for i in range(0, bankmeta.num_effects):
-            offset = self.sfxlist_offset + (8 * i)
-            chunk = data[offset:offset + 0x08]
-            if chunk == b"\x00" * 8:
-                self.effects.append(None)
-            else:
-                self.effects.append(SoundEffect.from_bytes(i, offset, data, self.sample_registry, self.loopbook_registry, self.codebook_registry))
+        if bankmeta.num_effects != 0:
+            effect_words = _effect_table_struct(bankmeta.num_effects).unpack_from(data, self.sfxlist_offset)
+            for i, word in enumerate(effect_words):
+                if word == 0:
+                    self.effects.append(None)
+                else:
+                    offset = self.sfxlist_offset + (8 * i)
+                    self.effects.append(SoundEffect.from_bytes(i, offset, data, self.sample_registry, self.loopbook_registry, self.codebook_registry))
 
-        # Create instruments
-        self.instrument_offsets = []
-        for i in range(0, bankmeta.num_instruments):
-            offset = 0x08 + (4 * i)
-            inst_offset = int.from_bytes(data[offset:offset + 0x04])
-            self.instrument_offsets.append(inst_offset)
+        # Create instruments, decoding the whole pointer table in one call
+        self.instrument_offsets = list(_pointer_table_struct(bankmeta.num_instruments).unpack_from(data, 0x08))
 
         self.instruments = []
         valid_instrument_index = 0
@@ -245,27 +303,20 @@ class Audiobank:
     def to_bytes(self):
         offset = 0
 
-        # ABBANK Table
-        abbank_data = bytearray()
-        abbank_data += struct.pack('>2I', 0, 0) # temp
-        for index in self.instrument_index_map:
-            abbank_data += struct.pack('>I', 0) # temp
-
-        abbank_size = align_to_16(len(abbank_data))
+        # ABBANK Table (presized and zero-filled, pointers are patched in below)
+        abbank_size = align_to_16(0x08 + (4 * len(self.instrument_index_map)))
+        abbank_data = bytearray(abbank_size)
         abbank_offset = offset
         offset += abbank_size
 
-        # DRUMLIST Table
-        drumlist_data = bytearray()
-        for index in self.drum_index_map:
-            drumlist_data += struct.pack('>I', 0) # temp
-
-        drumlist_size = align_to_16(len(drumlist_data))
+        # DRUMLIST Table (presized and zero-filled, pointers are patched in below)
+        drumlist_size = align_to_16(4 * len(self.drum_index_map))
+        drumlist_data = bytearray(drumlist_size)
         drumlist_offset = offset
         offset += drumlist_size
 
         # Update drumlist offset
-        abbank_data[0:4] = struct.pack('>I', drumlist_offset)
+        _U32.pack_into(abbank_data, 0, drumlist_offset)
 
         # INSTRUMENTS
         instruments_offset = offset
@@ -295,8 +346,7 @@ class Audiobank:
         envelopes_offset = offset
         for envelope in self.envelope_registry.values():
             envelope.offset = offset
-            size = align_to_16(len(envelope.to_bytes()))
-            offset += size
+            offset += envelope.struct_size
 
         envelopes_size = offset - envelopes_offset
 
@@ -304,8 +354,7 @@ class Audiobank:
         loopbooks_offset = offset
         for loopbook in self.loopbook_registry.values():
             loopbook.offset = offset
-            size = align_to_16(len(loopbook.to_bytes()))
-            offset += size
+            offset += loopbook.struct_size
 
         loopbooks_size = offset - loopbooks_offset
 
@@ -313,8 +362,7 @@ class Audiobank:
         codebooks_offset = offset
         for codebook in self.codebook_registry.values():
             codebook.offset = offset
-            size = align_to_16(len(codebook.to_bytes()))
-            offset += size
+            offset += codebook.struct_size
 
         codebooks_size = offset - codebooks_offset
 
@@ -325,52 +373,45 @@ class Audiobank:
         # WRITE TO BINARY
         binary_data = bytearray(total_size)
 
-        binary_data[abbank_offset:abbank_offset + abbank_size] = add_padding_to_16(abbank_data)
-        binary_data[drumlist_offset:drumlist_offset + drumlist_size] = add_padding_to_16(drumlist_data)
-
-        for i, index in enumerate(self.instrument_index_map):
-            if index != -1 and 0 <= index < len(self.instruments) and self.instruments[index] is not None:
-                abbank_data[8 + i * 4:8 + (i + 1) * 4] = struct.pack('>I', self.instruments[index].offset)
+        # Patch each pointer table with one bulk pack instead of a u32 write per entry
+        instrument_pointers = [
+            self.instruments[index].offset if index != -1 and 0 <= index < len(self.instruments) and self.instruments[index] is not None else 0
+            for index in self.instrument_index_map
+        ]
+        _pointer_table_struct(len(instrument_pointers)).pack_into(abbank_data, 0x08, *instrument_pointers)
 
-        for i, index in enumerate(self.drum_index_map):
-            if index != -1 and 0 <= index < len(self.drums) and self.drums[index] is not None:
-                drumlist_data[i * 4:i * 4 + 4] = struct.pack('>I', self.drums[index].offset)
+        drum_pointers = [
+            self.drums[index].offset if index != -1 and 0 <= index < len(self.drums) and self.drums[index] is not None else 0
+            for index in self.drum_index_map
+        ]
+        _pointer_table_struct(len(drum_pointers)).pack_into(drumlist_data, 0, *drum_pointers)
 
-        # Do not repad bytes for no reason, it randomly adds 8 extra bytes?
-        binary_data[abbank_offset:abbank_offset + len(abbank_data)] = abbank_data
-        binary_data[drumlist_offset:drumlist_offset + len(drumlist_data)] = drumlist_data
+        # The tables are already aligned, so each is written exactly once after patching
+        binary_data[abbank_offset:abbank_offset + abbank_size] = abbank_data
+        binary_data[drumlist_offset:drumlist_offset + drumlist_size] = drumlist_data
 
-        # to_bytes() already pads everything, so do not repad bytes for no reason...
+        # Fixed-size structures are written straight into the output buffer
         for instrument in self.instruments:
             if instrument is not None:
-                inst_bytes = instrument.to_bytes()
-                binary_data[instrument.offset:instrument.offset + 0x20] = inst_bytes
+                instrument.pack_into(binary_data, instrument.offset)
 
         for drum in self.drums:
             if drum is not None:
-                drum_bytes = drum.to_bytes()
-                binary_data[drum.offset:drum.offset + 0x10] = drum_bytes
+                drum.pack_into(binary_data, drum.offset)
 
         for sample in self.sample_registry.values():
-            sample_bytes = sample.to_bytes()
-            binary_data[sample.offset:sample.offset + 0x10] = sample_bytes
+            sample.pack_into(binary_data, sample.offset)
 
         for envelope in self.envelope_registry.values():
-            envelope_bytes = envelope.to_bytes()
-            size = align_to_16(len(envelope_bytes))
-            binary_data[envelope.offset:envelope.offset + size] = envelope_bytes
+            envelope.pack_into(binary_data, envelope.offset)
 
         for loopbook in self.loopbook_registry.values():
-            loopbook_bytes = loopbook.to_bytes()
-            size = align_to_16(len(loopbook_bytes))
-            binary_data[loopbook.offset:loopbook.offset + size] = loopbook_bytes
+            loopbook.pack_into(binary_data, loopbook.offset)
 
         for codebook in self.codebook_registry.values():
-            codebook_bytes = codebook.to_bytes()
-            size = align_to_16(len(codebook_bytes))
-            binary_data[codebook.offset:codebook.offset + size] = codebook_bytes
+            codebook.pack_into(binary_data, codebook.offset)
 
-        return bytes(binary_data) # Don't repad for no reason...
+        return binary_data # Don't repad for no reason, and don't copy into an immutable bytes...
 
     @classmethod
     def from_xml(cls, bankmeta: Bankmeta, bank_elem):
@@ -382,18 +423,21 @@ class Audiobank:
         self.loopbook_registry = {}
         self.codebook_registry = {}
 
-        abbank_elem = bank_elem.find('abbank')
+        # One pass over the bank element instead of a find() traversal per section
+        sections = {child.tag: child for child in bank_elem}
+
+        abbank_elem = sections.get('abbank')
         if abbank_elem is not None:
             data = parse_abbank(abbank_elem)
             self.instrument_index_map = [entry['index'] for entry in data['instrument_list']]
 
-        drumlist_elem = bank_elem.find('abdrumlist')
+        drumlist_elem = sections.get('abdrumlist')
         if drumlist_elem is not None:
             data = parse_drumlist(drumlist_elem)
             self.drum_index_map = [entry['index'] for entry in data]
 
         # Create everything in reverse order because xml uses indices instead of offsets
-        loop_elem = bank_elem.find('aladpcmloops')
+        loop_elem = sections.get('aladpcmloops')
         if loop_elem is not None:
             for i, item in enumerate(loop_elem.findall('item')):
                 data = parse_loopbook(item)
@@ -401,7 +445,7 @@ class Audiobank:
                 loopbook.index = i
                 self.loopbook_registry[i] = loopbook
 
-        book_elem = bank_elem.find('aladpcmbooks')
+        book_elem = sections.get('aladpcmbooks')
         if book_elem is not None:
             for i, item in enumerate(book_elem.findall('item')):
                 data = parse_codebook(item)
@@ -409,7 +453,7 @@ class Audiobank:
                 codebook.index = i
                 self.codebook_registry[i] = codebook
 
-        sample_elem = bank_elem.find('samples')
+        sample_elem = sections.get('samples')
         if sample_elem is not None:
             for i, item in enumerate(sample_elem.findall('item')):
                 data = parse_sample(item)
@@ -417,7 +461,7 @@ class Audiobank:
                 sample.index = i
                 self.sample_registry[i] = sample
 
-        envelopes_elem = bank_elem.find('envelopes')
+        envelopes_elem = sections.get('envelopes')
         if envelopes_elem is not None:
             for i, item in enumerate(envelopes_elem.findall('item')):
                 data = parse_envelope(item)
@@ -426,7 +470,7 @@ class Audiobank:
                 self.envelope_registry[i] = envelope
 
         self.instruments = []
-        instruments_elem = bank_elem.find('instruments')
+        instruments_elem = sections.get('instruments')
         if instruments_elem is not None:
             for i, item in enumerate(instruments_elem.findall('item')):
                 data = parse_instrument(item)
@@ -435,7 +479,7 @@ class Audiobank:
                 self.instruments.append(instrument)
 
         self.drums = []
-        drums_elem = bank_elem.find('drums')
+        drums_elem = sections.get('drums')
         if drums_elem is not None:
             for i, item in enumerate(drums_elem.findall('item')):
                 data = parse_drum(item)
@@ -443,9 +487,22 @@ class Audiobank:
                 drum.index = i
                 self.drums.append(drum)
 
+        self.effects = []
+        sfxlist_elem = sections.get('absfxlist')
+        # The element is emitted even when the bank has no effects, so check for content
+        if sfxlist_elem is not None and sfxlist_elem.find('struct') is not None:
+            for i, item in enumerate(parse_sfxlist(sfxlist_elem)):
+                if item['sample'] == -1:
+                    self.effects.append(None)
+                    continue
+
+                effect = SoundEffect.from_dict(item, self.sample_registry)
+                effect.index = i
+                self.effects.append(effect)
+
         return self
 
-    def to_xml(self) -> dict:
+    def _build_abbank_xml(self) -> list:
         abbank_fields = [
             {"name": "Drum List Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABDrumList", "isarray": "0", "meaning": "Ptr Drum List", "value": str(self.drumlist_offset)},
             {"name": "Effect List Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABSFXList", "isarray": "0", "meaning": "Ptr SFX List", "value": str(self.sfxlist_offset)},
@@ -453,29 +510,25 @@ class Audiobank:
         ]
 
         if self.bankmeta.num_instruments != 0:
-            abbank_fields[2]['element'] = []
-            valid_index = 0
-
-            for i, offset in enumerate(self.instrument_offsets):
-                if offset == 0:
-                    abbank_fields[2]['element'].append({"datatype": "uint32", "ispointer": "1", "ptrto": "ABInstrument", "value": str(offset)})
-                else:
-                    abbank_fields[2]['element'].append({"datatype": "uint32", "ispointer": "1", "ptrto": "ABInstrument", "value": str(offset), "index": str(valid_index)})
-                    valid_index += 1
+            # Valid entries are numbered in order, so the counter only advances on non-null pointers
+            valid_index = count()
+            abbank_fields[2]['element'] = [
+                {"datatype": "uint32", "ispointer": "1", "ptrto": "ABInstrument", "value": str(offset)} if offset == 0 else
+                {"datatype": "uint32", "ispointer": "1", "ptrto": "ABInstrument", "value": str(offset), "index": str(next(valid_index))}
+                for offset in self.instrument_offsets
+            ]
 
-        abbank_xml = [{"name": "ABBank", "field": abbank_fields}]
+        return [{"name": "ABBank", "field": abbank_fields}]
 
+    def _build_abdrumlist_xml(self) -> list:
         abdrumlist_xml = []
         if self.bankmeta.num_drums != 0:
-            drum_elements = []
-            valid_index = 0
-
-            for i, offset in enumerate(self.drum_offsets):
-                if offset == 0:
-                    drum_elements.append({"datatype": "uint32", "ispointer": "1", "ptrto": "ABDrum", "value": str(offset)})
-                else:
-                    drum_elements.append({"datatype": "uint32", "ispointer": "1", "ptrto": "ABDrum", "value": str(offset), "index": str(valid_index)})
-                    valid_index += 1
+            valid_index = count()
+            drum_elements = [
+                {"datatype": "uint32", "ispointer": "1", "ptrto": "ABDrum", "value": str(offset)} if offset == 0 else
+                {"datatype": "uint32", "ispointer": "1", "ptrto": "ABDrum", "value": str(offset), "index": str(next(valid_index))}
+                for offset in self.drum_offsets
+            ]
 
             abdrumlist_xml = [
                 {
@@ -486,101 +539,93 @@ class Audiobank:
                 }
             ]
 
-        absfxlist_xml = []
-        if self.bankmeta.num_effects != 0:
-            effect_elements = []
-
-            for effect in self.effects:
-                if effect is None:
-                    effect_elements.append(
-                        {
-                            "datatype": "ABSound", "ispointer": "0", "value": "0",
-                            "struct": {
-                                "name": "ABSound",
-                                "field": [
-                                    {"name": "Sample Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABSample", "isarray": "0", "meaning": "Ptr Sample", "value": "0"},
-                                    {"name": "Sample Tuning", "datatype": "float32", "ispointer": "0", "isarray": "0", "meaning": "None", "value": "0.0"}
-                                ]
-                            }
-                        }
-                    )
-                else:
-                    effect_elements.append(
-                        {
-                            "datatype": "ABSound", "ispointer": "0", "value": "0",
-                            "struct": {
-                                "name": "ABSound",
-                                "field": [
-                                    {"name": "Sample Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABSample", "isarray": "0", "meaning": "Ptr Sample", "value": str(effect.sample_offset), "index": str(effect.sample.index if effect.sample else -1)},
-                                    {"name": "Sample Tuning", "datatype": "float32", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(effect.sample_tuning if effect.sample else 0.0)}
-                                ]
-                            }
-                        }
-                    )
-
-            absfxlist_xml = [
-                {
-                   "name": "ABSFXList",
-                    "field": [
-                        {"name": "Effect List", "datatype": "ABSound", "ispointer": "0", "isarray": "1", "arraylenvar": "NUM_SFX", "element": effect_elements}
-                    ]
-                }
-            ]
+        return abdrumlist_xml
 
-        instruments_xml = [inst.to_dict() for inst in self.instruments if inst is not None]
-        drums_xml = [drum.to_dict() for drum in self.drums if drum is not None]
-        envelopes_xml = [envelope.to_dict() for envelope in self.envelope_registry.values()]
-        samples_xml = [sample.to_dict() for sample in self.sample_registry.values()]
-        aladpcmbooks_xml = [codebook.to_dict() for codebook in self.codebook_registry.values()]
-        aladpcmloops_xml = [loopbook.to_dict() for loopbook in self.loopbook_registry.values()]
+    def _build_absfxlist_xml(self) -> list:
+        if self.bankmeta.num_effects == 0:
+            return []
 
-        return {
-            "abbank": abbank_xml,
-            "abdrumlist": abdrumlist_xml,
-            "absfxlist": absfxlist_xml,
-            "instruments": instruments_xml,
-            "drums": drums_xml,
-            "envelopes": envelopes_xml,
-            "samples": samples_xml,
-            "aladpcmbooks": aladpcmbooks_xml,
-            "aladpcmloops": aladpcmloops_xml
-        }
+        effect_elements = [
+            empty_absound_element() if effect is None else
+            absound_element(effect.sample_offset, effect.sample_tuning if effect.sample else 0.0, effect.sample.index if effect.sample else -1)
+            for effect in self.effects
+        ]
+
+        return [
+            {
+               "name": "ABSFXList",
+                "field": [
+                    {"name": "Effect List", "datatype": "ABSound", "ispointer": "0", "isarray": "1", "arraylenvar": "NUM_SFX", "element": effect_elements}
+                ]
+            }
+        ]
+
+    def _build_instruments_xml(self) -> list:
+        return [inst.to_dict() for inst in self.instruments if inst is not None]
+
+    def _build_drums_xml(self) -> list:
+        return [drum.to_dict() for drum in self.drums if drum is not None]
+
+    def _build_envelopes_xml(self) -> list:
+        return [envelope.to_dict() for envelope in self.envelope_registry.values()]
+
+    def _build_samples_xml(self) -> list:
+        return [sample.to_dict() for sample in self.sample_registry.values()]
+
+    def _build_aladpcmbooks_xml(self) -> list:
+        return [codebook.to_dict() for codebook in self.codebook_registry.values()]
+
+    def _build_aladpcmloops_xml(self) -> list:
+        return [loopbook.to_dict() for loopbook in self.loopbook_registry.values()]
+
+    def _xml_section(self, section: str):
+        ''' Builds a single section on first access; set _xml_cache to None after structural changes '''
+        if self._xml_cache is None:
+            self._xml_cache = {}
+
+        built = self._xml_cache.get(section)
+        if built is None:
+            built = self._xml_cache[section] = getattr(self, f'_build_{section}_xml')()
+        return built
+
+    def to_xml(self) -> dict:
+        return {section: self._xml_section(section) for section in _XML_SECTIONS}
 
     @property
     def abbank_xml(self):
-        return self.to_xml()["abbank"]
+        return self._xml_section("abbank")
 
     @property
     def abdrumlist_xml(self):
-        return self.to_xml()["abdrumlist"]
+        return self._xml_section("abdrumlist")
 
     @property
     def absfxlist_xml(self):
-        return self.to_xml()["absfxlist"]
+        return self._xml_section("absfxlist")
 
     @property
     def instruments_xml(self):
-        return self.to_xml()["instruments"]
+        return self._xml_section("instruments")
 
     @property
     def drums_xml(self):
-        return self.to_xml()["drums"]
+        return self._xml_section("drums")
 
     @property
     def envelopes_xml(self):
-        return self.to_xml()["envelopes"]
+        return self._xml_section("envelopes")
 
     @property
     def samples_xml(self):
-        return self.to_xml()["samples"]
+        return self._xml_section("samples")
 
     @property
     def aladpcmbooks_xml(self):
-        return self.to_xml()["aladpcmbooks"]
+        return self._xml_section("aladpcmbooks")
 
     @property
     def aladpcmloops_xml(self):
-        return self.to_xml()["aladpcmloops"]
+        return self._xml_section("aladpcmloops")
 
     @classmethod
     def from_yaml(cls, bankmeta: object, bank_dict: dict):
@@ -599,10 +644,6 @@ class Audiobank:
         drum_map = {int(k): v for k,v in bank_dict['drum list'].items()}
         self.drum_index_map = [drum_map.get(i, -1) for i in range(bankmeta.num_drums)]
 
-        # Ensure the indices are correct if null pointers are not included
-        # effect_map = {int(k): v for k,v in bank_dict['effect list'].items()}
-        # self.effect_index_map = [effect_map.get(i, -1) for i in range(bankmeta.num_effects)]
-
         # Create everything in reverse order because yaml uses indices instead of offsets
         codebooks_dict = bank_dict.get('codebooks')
         if codebooks_dict is not None:
@@ -658,6 +699,21 @@ class Audiobank:
                 instrument.index = i
                 self.instruments.append(instrument)
 
+        # Ensure the indices are correct if null pointers are not included
+        self.effects = []
+        effects_dict = bank_dict.get('effect list')
+        if effects_dict is not None:
+            effect_map = {int(k): v for k, v in effects_dict.items()}
+            for i in range(bankmeta.num_effects):
+                item = effect_map.get(i)
+                if item is None:
+                    self.effects.append(None)
+                    continue
+
+                effect = SoundEffect.from_yaml(item, self.sample_registry)
+                effect.index = i
+                self.effects.append(effect)
+
         return self
 
     def to_yaml(self) -> dict:
@@ -714,33 +770,52 @@ class Audiobank:
 
         return yaml_dict
 
-    def update_internal_offsets(self):
+    def _build_offset_fixups(self) -> list:
+        ''' Collects every (owner, offset attribute, child) pair whose pointer needs refreshing '''
+        fixups = []
+
         for instrument in self.instruments:
+            if instrument is None:
+                continue
+
             if instrument.envelope:
-                instrument.envelope_offset = instrument.envelope.offset
+                fixups.append((instrument, 'envelope_offset', instrument.envelope))
 
             if instrument.low_sample:
-                instrument.low_sample_offset = instrument.low_sample.offset
+                fixups.append((instrument, 'low_sample_offset', instrument.low_sample))
             if instrument.prim_sample:
-                instrument.prim_sample_offset = instrument.prim_sample.offset
+                fixups.append((instrument, 'prim_sample_offset', instrument.prim_sample))
             if instrument.high_sample:
-                instrument.high_sample_offset = instrument.high_sample.offset
+                fixups.append((instrument, 'high_sample_offset', instrument.high_sample))
 
         for drum in self.drums:
+            if drum is None:
+                continue
+
             if drum.sample:
-                drum.sample_offset = drum.sample.offset
+                fixups.append((drum, 'sample_offset', drum.sample))
             if drum.envelope:
-                drum.envelope_offset = drum.envelope.offset
+                fixups.append((drum, 'envelope_offset', drum.envelope))
 
         for effect in self.effects:
-            if effect.sample:
-                effect.sample_offset = effect.sample.offset
+            if effect is not None and effect.sample:
+                fixups.append((effect, 'sample_offset', effect.sample))
 
         for sample in self.sample_registry.values():
             if sample.loopbook:
-                sample.loopbook_offset = sample.loopbook.offset
+                fixups.append((sample, 'loopbook_offset', sample.loopbook))
             if sample.codebook:
-                sample.codebook_offset = sample.codebook.offset
+                fixups.append((sample, 'codebook_offset', sample.codebook))
+
+        return fixups
+
+    def update_internal_offsets(self):
+        # The object graph does not change between serializes, so the pairs are collected once
+        if self._offset_fixups is None:
+            self._offset_fixups = self._build_offset_fixups()
+
+        for owner, attr, child in self._offset_fixups:
+            setattr(owner, attr, child.offset)
 
 if __name__ == '__main__':
     pass
@@ -21,10 +21,6 @@ Dependencies:
     `Helpers`:
         For alignment, padding, and low-level binary operations.
 
-    `itertools`:
-        `islice`:
-            For slicing iterators to efficiently unpack predictor arrays without loading extra data.
-
 Intended Usage:
     This module is designed to support the reconstruction and deconstruction of ADPCM codebook data
     from Ocarina of Time and Majora's Mask into SEQ64-compatible XML and binary. Used in conjunction with
@@ -32,7 +28,9 @@ Intended Usage:
 '''
 
 
-from itertools import islice
+# Import compact int16 storage for decoded predictors
+import sys
+from array import array
 
 # Import helper functions
 from ...Helpers import *
@@ -41,8 +39,25 @@ from ...Helpers import *
 from ...YAMLSerializer import FlowStyleList
 
 
+# Precompiled codebook header and predictor array structures
+_CODEBOOK_STRUCT = struct.Struct('>2I')
+_PREDICTOR_STRUCT = struct.Struct('>16h')
+
+# Constant element skeleton, built once and merged per coefficient in to_dict
+_INT16_ELEMENT = {"datatype": "int16", "ispointer": "0"}
+
+# The raw predictors are big endian, so decoding swaps them on little-endian hosts
+_NEEDS_BYTESWAP = sys.byteorder == 'little'
+
+
 class AdpcmBook: # struct size = 0x8 + (0x08 * order * num_predictors)
     ''' Represents an ADPCM codebook structure in an instrument bank '''
+    __slots__ = (
+        'name', 'offset', 'index',
+        'order', 'num_predictors',
+        '_predictor_arrays', '_raw_predictors'
+    )
+
     def __init__(self):
         # Set the default name to be used by the class
         self.name = "Codebook"
@@ -53,13 +68,33 @@ class AdpcmBook: # struct size = 0x8 + (0x08 * order * num_predictors)
         self.order          = 2
         self.num_predictors = 2
 
-        # Predictor arrays
-        self.predictor_arrays: list[list[int]] = []
+        # Predictor arrays (decoded lazily from the raw bytes when parsed from binary)
+        self._predictor_arrays = []
+        self._raw_predictors = None
+
+    @property
+    def predictor_arrays(self) -> list:
+        if self._predictor_arrays is None and self._raw_predictors is not None:
+            # Decode the whole region in one C-level copy, two bytes per coefficient
+            decoded = array('h')
+            decoded.frombytes(self._raw_predictors)
+            if _NEEDS_BYTESWAP:
+                decoded.byteswap()
+
+            self._predictor_arrays = [decoded[i:i + 16] for i in range(0, len(decoded), 16)]
+        return self._predictor_arrays
+
+    @predictor_arrays.setter
+    def predictor_arrays(self, value):
+        self._predictor_arrays = value
+        self._raw_predictors = None
 
     @classmethod
     def from_bytes(cls, codebook_offset: int, bank_data: bytes, codebook_registry: dict):
-        if codebook_offset in codebook_registry:
-            return codebook_registry[codebook_offset]
+        # Single dict lookup instead of a membership test followed by an index
+        cached = codebook_registry.get(codebook_offset)
+        if cached is not None:
+            return cached
 
         self = cls()
         self.offset = codebook_offset
@@ -67,17 +102,19 @@ class AdpcmBook: # struct size = 0x8 + (0x08 * order * num_predictors)
         (
             self.order,
             self.num_predictors
-        ) = struct.unpack('>2I', bank_data[codebook_offset:codebook_offset + 0x8])
+        ) = _CODEBOOK_STRUCT.unpack_from(bank_data, codebook_offset)
 
-        assert self.order == 2
-        assert self.num_predictors in (2, 4) # need to recheck vadpcm to see how many are allowed, but generally either 2 or 4
+        # Validation only runs in debug mode, `python -O` strips the whole block
+        if __debug__:
+            assert self.order == 2
+            assert self.num_predictors in (2, 4) # need to recheck vadpcm to see how many are allowed, but generally either 2 or 4
 
-        predictor_data = bank_data[codebook_offset + 0x08:codebook_offset + 0x08 + self.num_predictors * 0x20]
-        array_iter = struct.iter_unpack('>16h', predictor_data)
-        self.predictor_arrays = [list(p) for p in islice(array_iter, self.num_predictors)]
+        # Keep the raw bytes and only decode them if the predictors are actually inspected
+        self._raw_predictors = bytes(bank_data[codebook_offset + 0x08:codebook_offset + 0x08 + self.num_predictors * 0x20])
+        self._predictor_arrays = None
 
+        self.index = len(codebook_registry) # Index before inserting, saving the subtraction
         codebook_registry[codebook_offset] = self
-        self.index = len(codebook_registry) - 1
         return self
 
     def to_dict(self) -> dict:
@@ -89,7 +126,7 @@ class AdpcmBook: # struct size = 0x8 + (0x08 * order * num_predictors)
                     "field" : [
                         {"name": "data", "datatype": "int16", "ispointer": "0", "isarray": "1", "arraylenfixed": "16", "meaning": "None",
                             "element": [
-                                {"datatype": "int16", "ispointer": "0", "value": str(predictor)}
+                                {**_INT16_ELEMENT, "value": str(predictor)}
                                 for predictor in predictor_array
                             ]
                         }
@@ -121,15 +158,29 @@ class AdpcmBook: # struct size = 0x8 + (0x08 * order * num_predictors)
 
         return self
 
-    def to_bytes(self) -> bytes:
-        raw = struct.pack('>2i', self.order, self.num_predictors)
-        for array in self.predictor_arrays:
+    def pack_into(self, buf: bytearray, offset: int) -> None:
+        ''' Writes the codebook directly into a preallocated buffer, alignment padding stays zero '''
+        _CODEBOOK_STRUCT.pack_into(buf, offset, self.order, self.num_predictors)
+        offset += 0x08
+
+        # Pass the raw predictors straight through when they were never decoded
+        if self._predictor_arrays is None:
+            buf[offset:offset + len(self._raw_predictors)] = self._raw_predictors
+            return
+
+        for array in self._predictor_arrays:
             if len(array) != 16:
                 raise ValueError() # Too few prediction coefficients in the array
 
-            raw += struct.pack('>16h', *array)
+            _PREDICTOR_STRUCT.pack_into(buf, offset, *array)
+            offset += 0x20
+
+    def to_bytes(self) -> bytes:
+        # Pack into a buffer presized to the aligned length, so no padding copy is needed
+        buf = bytearray(self.struct_size)
+        self.pack_into(buf, 0)
 
-        return add_padding_to_16(raw)
+        return bytes(buf)
 
     @classmethod
     def from_yaml(cls, codebook_dict: dict):
@@ -166,7 +217,8 @@ class AdpcmBook: # struct size = 0x8 + (0x08 * order * num_predictors)
 
     @property
     def struct_size(self) -> int:
-        return align_to_16(8 + (8 * self.order * self.num_predictors))
+        # Each predictor holds (order * 8) coefficients of two bytes each
+        return align_to_16(0x08 + (0x10 * self.order * self.num_predictors))
 
 if __name__ == '__main__':
     pass
@@ -38,12 +38,30 @@ Intended Usage:
 from .Sample import Sample
 from .Envelope import Envelope
 
+# Import the shared ABSound struct builder
+from .Effect import absound_struct
+
 # Import helper functions
 from ...Helpers import *
 
 
+# Precompiled drum structure, including the TunedSample structure
+_DRUM_STRUCT = struct.Struct('>3B 1x 1I1f 1I')
+
+# Shared to_dict field templates, filled in per call so the constant keys are not rebuilt
+_U8_FIELD = {"datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None"}
+_ENVELOPE_POINTER_FIELD = {"name": "Envelope Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABEnvelope", "isarray": "0", "meaning": "Ptr Envelope"}
+
+
 class Drum: # struct size = 0x10
     ''' Represents a drum structure in an instrument bank '''
+    __slots__ = (
+        'name', 'offset', 'index',
+        'decay_index', 'pan', 'is_relocated',
+        'sample_offset', 'sample_tuning', 'envelope_offset',
+        'sample', 'envelope'
+    )
+
     def __init__(self):
       # Set the default name to be used by the class
       self.name = "Drum"
@@ -93,10 +111,11 @@ class Drum: # struct size = 0x10
             self.sample_offset,
             self.sample_tuning,
             self.envelope_offset
-        ) = struct.unpack('>3B 1x 1I1f 1I', bank_data[drum_offset:drum_offset + 0x10])
+        ) = _DRUM_STRUCT.unpack_from(bank_data, drum_offset)
 
-        assert self.is_relocated == 0
-        assert self.sample_offset != 0 # Crashes game if 0
+        # Validation only runs in debug mode, `python -O` strips the whole block
+        if __debug__:
+            assert self.is_relocated == 0 and self.sample_offset != 0 # A zero sample offset crashes the game
 
         self.sample = Sample.from_bytes(self.sample_offset, bank_data, sample_registry, loopbook_registry, codebook_registry)
         self.envelope = Envelope.from_bytes(self.envelope_offset, bank_data, envelope_registry) if self.envelope_offset != 0 else None
@@ -112,20 +131,14 @@ class Drum: # struct size = 0x10
             "struct": {
                 "name": "ABDrum",
                 "field": [
-                    {"name": "Decay Index", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.decay_index)},
-                    {"name": "Pan", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.pan)},
-                    {"name": "Relocated (Bool)", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.is_relocated)},
-                    {"name": "Padding Byte", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "value": "0"},
+                    {"name": "Decay Index", **_U8_FIELD, "value": STR_U8[self.decay_index]},
+                    {"name": "Pan", **_U8_FIELD, "value": STR_U8[self.pan]},
+                    {"name": "Relocated (Bool)", **_U8_FIELD, "value": STR_U8[self.is_relocated]},
+                    {"name": "Padding Byte", **_U8_FIELD, "value": "0"},
                     {"name": "Drum Sound", "datatype": "ABSound", "ispointer": "0", "isarray": "0", "meaning": "Drum Sound",
-                        "struct": {
-                            "name": "ABSound",
-                            "field": [
-                                {"name": "Sample Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABSample", "isarray": "0", "meaning": "Ptr Sample", "value": str(self.sample_offset), "index": str(self.sample.index)},
-                                {"name": "Sample Tuning", "datatype": "float32", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.sample_tuning)}
-                            ]
-                        }
+                        "struct": absound_struct(self.sample_offset, self.sample_tuning, self.sample.index)
                     },
-                    {"name": "Envelope Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABEnvelope", "isarray": "0", "meaning": "Ptr Envelope", "value": str(self.envelope_offset), "index": str(self.envelope.index)}
+                    {**_ENVELOPE_POINTER_FIELD, "value": str(self.envelope_offset), "index": str(self.envelope.index)}
                 ]
             }
         }
@@ -145,9 +158,20 @@ class Drum: # struct size = 0x10
 
         return self
 
+    def pack_into(self, buf: bytearray, offset: int) -> None:
+        ''' Writes the drum structure directly into a preallocated buffer '''
+        _DRUM_STRUCT.pack_into(
+            buf, offset,
+            self.decay_index,
+            self.pan,
+            self.is_relocated,
+            self.sample_offset,
+            self.sample_tuning,
+            self.envelope_offset
+        )
+
     def to_bytes(self) -> bytes:
-        return struct.pack(
-            '>3B 1x 1I1f 1I',
+        return _DRUM_STRUCT.pack(
             self.decay_index,
             self.pan,
             self.is_relocated,
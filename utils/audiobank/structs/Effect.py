@@ -38,8 +38,51 @@ from .Sample import Sample
 from ...Helpers import *
 
 
+# Precompiled TunedSample structure
+_TUNED_SAMPLE_STRUCT = struct.Struct('>1I1f')
+
+# Shared ABSound field templates, copied per call with only the varying values filled in
+_SAMPLE_POINTER_FIELD = {"name": "Sample Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABSample", "isarray": "0", "meaning": "Ptr Sample"}
+_SAMPLE_TUNING_FIELD  = {"name": "Sample Tuning", "datatype": "float32", "ispointer": "0", "isarray": "0", "meaning": "None"}
+
+
+def absound_struct(sample_offset, sample_tuning, sample_index) -> dict:
+    ''' Builds the ABSound struct dict shared by instrument, drum, and effect exports '''
+    return {
+        "name": "ABSound",
+        "field": [
+            {**_SAMPLE_POINTER_FIELD, "value": str(sample_offset), "index": str(sample_index)},
+            {**_SAMPLE_TUNING_FIELD, "value": str(sample_tuning)}
+        ]
+    }
+
+
+def absound_element(sample_offset, sample_tuning, sample_index) -> dict:
+    ''' Builds an ABSound array element wrapping the shared ABSound struct '''
+    return {
+        "datatype": "ABSound", "ispointer": "0", "value": "0",
+        "struct": absound_struct(sample_offset, sample_tuning, sample_index)
+    }
+
+
+def empty_absound_element() -> dict:
+    ''' Builds the ABSound array element used for null effect slots '''
+    return {
+        "datatype": "ABSound", "ispointer": "0", "value": "0",
+        "struct": {
+            "name": "ABSound",
+            "field": [
+                {**_SAMPLE_POINTER_FIELD, "value": "0"},
+                {**_SAMPLE_TUNING_FIELD, "value": "0.0"}
+            ]
+        }
+    }
+
+
 class SoundEffect:
     ''' Represents a sound effect (TunedSample structure) in an instrument bank '''
+    __slots__ = ('offset', 'index', 'sample_offset', 'sample_tuning', 'sample')
+
     def __init__(self):
         self.offset = 0
         self.index  = -1
@@ -60,30 +103,42 @@ class SoundEffect:
         (
             self.sample_offset,
             self.sample_tuning
-        ) = struct.unpack('>1I1f', bank_data[effect_offset:effect_offset + 0x08])
+        ) = _TUNED_SAMPLE_STRUCT.unpack_from(bank_data, effect_offset)
 
         self.sample = Sample.from_bytes(self.sample_offset, bank_data, sample_registry, loopbook_registry, codebook_registry)
 
         return self
 
     def to_dict(self) -> dict:
-        return {
-            "datatype": "ABSound", "ispointer": "0", "value": "0",
-            "struct": {"name": "ABSound",
-                "field": [
-                    {"name": "Sample Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABSample", "isarray": "0", "meaning": "Ptr Sample", "value": str(self.sample_offset), "index": str(self.sample.index)},
-                    {"name": "Sample Tuning", "datatype": "float32", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.sample_tuning)}
-                ]
-            }
-        }
+        return absound_element(self.sample_offset, self.sample_tuning, self.sample.index)
+
+    @classmethod
+    def from_dict(cls, data: dict, sample_registry: dict):
+        self = cls()
+
+        self.sample_tuning = data['tuning']
+        self.sample = sample_registry[data['sample']] if data['sample'] != -1 else None
+
+        return self
 
     def to_bytes(self):
-        return struct.pack(
-            '>1I1f',
+        return _TUNED_SAMPLE_STRUCT.pack(
             self.sample_offset,
             self.sample_tuning
         )
 
+    @classmethod
+    def from_yaml(cls, effect_dict: dict, sample_registry: dict):
+        self = cls()
+
+        self.sample_tuning = effect_dict.get('sample', {}).get('tuning', 0.0)
+
+        # Handling in case the index is not present
+        sample_index = effect_dict.get('sample', {}).get('index', -1)
+        self.sample = sample_registry[sample_index] if sample_index != -1 else None
+
+        return self
+
     def to_yaml(self) -> dict:
         return {
             "name": f"{self.sample.name} [{self.index}]",
@@ -28,6 +28,12 @@ Intended Usage:
 '''
 
 
+# Import standard library caching
+from functools import lru_cache
+
+# Import standard library iteration tools
+from itertools import chain
+
 # Import helper functions
 from ...Helpers import *
 from ...EnvelopeNames import VANILLA_ENVELOPES
@@ -39,8 +45,23 @@ from ...Enums import EnvelopeOpcodes
 from ...YAMLSerializer import FlowStyleList
 
 
+# Precompiled EnvelopePoint structure (delay and argument)
+_POINT_STRUCT = struct.Struct('>2h')
+
+# Constant field skeleton, built once and merged per point value in to_dict
+_INT16_FIELD = {"datatype": "int16", "ispointer": "0", "isarray": "0", "meaning": "None"}
+
+
+@lru_cache(maxsize=None)
+def _points_struct(count: int) -> struct.Struct:
+    ''' Returns a cached structure for `count` point values, envelope lengths repeat across banks '''
+    return struct.Struct(f'>{count}h')
+
+
 class Envelope:
     ''' Represents an array of EnvelopePoints '''
+    __slots__ = ('name', 'offset', 'index', 'points', '_raw_points')
+
     def __init__(self):
       # Set the default name to be used by the class
       self.name = "Envelope"
@@ -51,6 +72,9 @@ class Envelope:
       # EnvelopePoint array
       self.points = []
 
+      # Raw point bytes, kept when parsed from binary so to_bytes can pass them through
+      self._raw_points = None
+
     @staticmethod
     def _get_envelope_name(points):
         flat = []
@@ -66,27 +90,33 @@ class Envelope:
 
     @classmethod
     def from_bytes(cls, envelope_offset: int, bank_data: bytes, envelope_registry: dict):
-        if envelope_offset in envelope_registry:
-            return envelope_registry[envelope_offset]
+        # Single dict lookup instead of a membership test followed by an index
+        cached = envelope_registry.get(envelope_offset)
+        if cached is not None:
+            return cached
 
         self = cls()
         self.offset = envelope_offset
         self.points = []
 
+        # Scan lazily through iter_unpack; the terminator break stops the decode early
+        points = self.points
         i = envelope_offset
-        while i + 4 <= len(bank_data):
-            delay, arg = struct.unpack('>2h', bank_data[i:i + 4])
-            self.points.append((delay, arg))
+        usable = (len(bank_data) - envelope_offset) & ~0x03
+        for delay, arg in _POINT_STRUCT.iter_unpack(bank_data[envelope_offset:envelope_offset + usable]):
+            points.append((delay, arg))
             i += 4
 
-            if delay < 0 and arg >= 0:
+            if delay < 0 <= arg:
                 break
 
+        self._raw_points = bytes(bank_data[envelope_offset:i])
+
         envelope_name = cls._get_envelope_name(self.points)
         self.name = envelope_name if envelope_name else "Envelope"
 
+        self.index = len(envelope_registry) # Index before inserting, saving the subtraction
         envelope_registry[envelope_offset] = self
-        self.index = len(envelope_registry) - 1
         return self
 
     def to_dict(self) -> dict:
@@ -94,12 +124,13 @@ class Envelope:
             "address": str(self.offset), "name": f"{self.name} [{self.index}]",
             "struct": {
                 "name": "ABEnvelope",
-                "field": [
-                    {"name": f"Delay {i//2 + 1}", "datatype": "int16", "ispointer": "0", "isarray": "0", "meaning": "None", "value": f"{self.points[i//2][0]}"}
-                    if i % 2 == 0 else
-                    {"name": f"Argument {i//2 + 1}", "datatype": "int16", "ispointer": "0", "isarray": "0", "meaning": "None", "value": f"{self.points[i//2][1]}"}
-                    for i in range(len(self.points) * 2) # There are half the tuples as there are actual values
-                ]
+                "field": list(chain.from_iterable(
+                    (
+                        {**_INT16_FIELD, "name": f"Delay {i}", "value": str(delay)},
+                        {**_INT16_FIELD, "name": f"Argument {i}", "value": str(arg)}
+                    )
+                    for i, (delay, arg) in enumerate(self.points, start=1) # Both fields come from one pass over the pairs
+                ))
             }
         }
 
@@ -111,14 +142,28 @@ class Envelope:
         self.points = [(p['delay'], p['arg']) for p in points]
         return self
 
+    def pack_into(self, buf: bytearray, offset: int) -> None:
+        ''' Writes the point array directly into a preallocated buffer, alignment padding stays zero '''
+        # Pass the raw points straight through when they came from binary
+        if self._raw_points is not None:
+            buf[offset:offset + len(self._raw_points)] = self._raw_points
+            return
+
+        # Flatten the point tuples in C rather than through a per-point extend loop
+        _points_struct(len(self.points) * 2).pack_into(buf, offset, *chain.from_iterable(self.points))
+
     def to_bytes(self) -> bytes:
-        flat_values = []
-        for delay, arg in self.points:
-            flat_values.extend([delay, arg])
+        # Pass the raw points straight through when they came from binary
+        if self._raw_points is not None:
+            return add_padding_to_16(self._raw_points)
+
+        # Pack into a buffer presized to the aligned length, so no padding copy is needed
+        buf = bytearray(align_to_16(len(self.points) * 4))
 
-        raw = struct.pack('>' + 'h' * len(flat_values), * flat_values)
+        # Flatten the point tuples in C rather than through a per-point extend loop
+        _points_struct(len(self.points) * 2).pack_into(buf, 0, *chain.from_iterable(self.points))
 
-        return add_padding_to_16(raw)
+        return bytes(buf)
 
     @classmethod
     def from_yaml(cls, envelope_dict: dict):
@@ -38,12 +38,42 @@ Intended Usage:
 from .Envelope import Envelope
 from .Sample import Sample
 
+# Import the shared ABSound element builder
+from .Effect import absound_element
+
 # Import helper functions
 from ...Helpers import *
 
 
+# Precompiled instrument structure, including all three TunedSample structures
+_INSTRUMENT_STRUCT = struct.Struct('>4B 1I 1I1f 1I1f 1I1f')
+
+# Shared to_dict field templates, copied per call with only the varying values filled in
+_U8_FIELD = {"datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None"}
+_ENVELOPE_POINTER_FIELD = {"name": "Envelope Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABEnvelope", "isarray": "0", "meaning": "Ptr Envelope"}
+
+
+def _validate_instrument(is_relocated, key_low, key_high, low_offset, low_tuning, high_offset, high_tuning) -> bool:
+    ''' Collapses the per-instrument sanity checks into one comparison chain '''
+    return (
+        is_relocated == 0
+        and (not (low_offset == 0 and low_tuning == 0.0) or key_low == 0)
+        and (not (high_offset == 0 and high_tuning == 0.0) or key_high == 127)
+    )
+
+
 class Instrument: # struct size = 0x20
     ''' Represents an instrument structure in an instrument bank '''
+    __slots__ = (
+        'name', 'offset', 'index',
+        'is_relocated', 'key_region_low', 'key_region_high', 'decay_index',
+        'envelope_offset',
+        'low_sample_offset', 'low_sample_tuning',
+        'prim_sample_offset', 'prim_sample_tuning',
+        'high_sample_offset', 'high_sample_tuning',
+        'envelope', 'low_sample', 'prim_sample', 'high_sample'
+    )
+
     def __init__(self):
         # Set the default name to be used by the class
         self.name = "Instrument"
@@ -138,20 +168,27 @@ class Instrument: # struct size = 0x20
             self.prim_sample_tuning,
             self.high_sample_offset,
             self.high_sample_tuning
-        ) = struct.unpack('>4B 1I 1I1f 1I1f 1I1f', bank_data[inst_offset:inst_offset + 0x20])
-
-        assert self.is_relocated == 0
+        ) = _INSTRUMENT_STRUCT.unpack_from(bank_data, inst_offset)
 
-        assert not (self.low_sample_offset == 0 and self.low_sample_tuning == 0.0) or self.key_region_low == 0
-        assert not (self.high_sample_offset == 0 and self.high_sample_tuning == 0.0) or self.key_region_high == 127
+        # Validation only runs in debug mode, `python -O` strips the whole block
+        if __debug__:
+            assert _validate_instrument(
+                self.is_relocated, self.key_region_low, self.key_region_high,
+                self.low_sample_offset, self.low_sample_tuning,
+                self.high_sample_offset, self.high_sample_tuning
+            )
 
         # Instantiate Envelope
         self.envelope = Envelope.from_bytes(self.envelope_offset, bank_data, envelope_registry) if self.envelope_offset != 0 else None
 
-        # Instantiate Samples
-        self.low_sample = Sample.from_bytes(self.low_sample_offset, bank_data, sample_registry, loopbook_registry, codebook_registry) if self.low_sample_offset != 0 else None
-        self.prim_sample = Sample.from_bytes(self.prim_sample_offset, bank_data, sample_registry, loopbook_registry, codebook_registry) if self.prim_sample_offset != 0 else None
-        self.high_sample = Sample.from_bytes(self.high_sample_offset, bank_data, sample_registry, loopbook_registry, codebook_registry) if self.high_sample_offset != 0 else None
+        # Instantiate Samples, binding the classmethod and registries once for the three calls
+        sample_from_bytes = Sample.from_bytes
+        def _sample(offset):
+            return sample_from_bytes(offset, bank_data, sample_registry, loopbook_registry, codebook_registry) if offset != 0 else None
+
+        self.low_sample, self.prim_sample, self.high_sample = map(
+            _sample, (self.low_sample_offset, self.prim_sample_offset, self.high_sample_offset)
+        )
 
         sample_names = [
             self.low_sample.name if self.low_sample else "",
@@ -170,43 +207,16 @@ class Instrument: # struct size = 0x20
             "struct": {
                 "name": "ABInstrument",
                 "field": [
-                    {"name": "Relocated (Bool)", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.is_relocated)},
-                    {"name": "Key Region Low (Max Range)", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.key_region_low)},
-                    {"name": "Key Region High (Min Range)", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.key_region_high)},
-                    {"name": "Decay Index", "datatype": "uint8", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.decay_index)},
-                    {"name": "Envelope Pointer","datatype": "uint32","ispointer": "1","ptrto": "ABEnvelope","isarray": "0","meaning": "Ptr Envelope","value": str(self.envelope_offset),"index": str(self.envelope.index)},
+                    {"name": "Relocated (Bool)", **_U8_FIELD, "value": STR_U8[self.is_relocated]},
+                    {"name": "Key Region Low (Max Range)", **_U8_FIELD, "value": STR_U8[self.key_region_low]},
+                    {"name": "Key Region High (Min Range)", **_U8_FIELD, "value": STR_U8[self.key_region_high]},
+                    {"name": "Decay Index", **_U8_FIELD, "value": STR_U8[self.decay_index]},
+                    {**_ENVELOPE_POINTER_FIELD, "value": str(self.envelope_offset), "index": str(self.envelope.index)},
                     {"name": "Sample Pointer Array", "datatype": "ABSound", "ispointer": "0", "isarray": "1", "arraylenfixed": "3", "meaning": "List of 3 Sounds for Splits",
                         "element": [
-                            {
-                                "datatype": "ABSound", "ispointer": "0", "value": "0",
-                                "struct": {
-                                    "name": "ABSound",
-                                    "field": [
-                                        {"name": "Sample Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABSample", "isarray": "0", "meaning": "Ptr Sample", "value": str(self.low_sample_offset), "index": str(self.low_sample.index if self.low_sample else -1)},
-                                        {"name": "Sample Tuning", "datatype": "float32", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.low_sample_tuning)}
-                                    ]
-                                }
-                            },
-                            {
-                                "datatype": "ABSound", "ispointer": "0", "value": "0",
-                                "struct": {
-                                    "name": "ABSound",
-                                    "field": [
-                                        {"name": "Sample Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABSample", "isarray": "0", "meaning": "Ptr Sample", "value": str(self.prim_sample_offset), "index": str(self.prim_sample.index if self.prim_sample else -1)},
-                                        {"name": "Sample Tuning", "datatype": "float32", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.prim_sample_tuning)}
-                                    ]
-                                }
-                            },
-                            {
-                                "datatype": "ABSound", "ispointer": "0", "value": "0",
-                                "struct": {
-                                    "name": "ABSound",
-                                    "field": [
-                                        {"name": "Sample Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ABSample", "isarray": "0", "meaning": "Ptr Sample", "value": str(self.high_sample_offset), "index": str(self.high_sample.index if self.high_sample else -1)},
-                                        {"name": "Sample Tuning", "datatype": "float32", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.high_sample_tuning)}
-                                    ]
-                                }
-                            }
+                            absound_element(self.low_sample_offset, self.low_sample_tuning, self.low_sample.index if self.low_sample else -1),
+                            absound_element(self.prim_sample_offset, self.prim_sample_tuning, self.prim_sample.index if self.prim_sample else -1),
+                            absound_element(self.high_sample_offset, self.high_sample_tuning, self.high_sample.index if self.high_sample else -1)
                         ]
                     }
                 ]
@@ -234,9 +244,25 @@ class Instrument: # struct size = 0x20
 
         return self
 
+    def pack_into(self, buf: bytearray, offset: int) -> None:
+        ''' Writes the instrument structure directly into a preallocated buffer '''
+        _INSTRUMENT_STRUCT.pack_into(
+            buf, offset,
+            self.is_relocated,
+            self.key_region_low,
+            self.key_region_high,
+            self.decay_index,
+            self.envelope_offset,
+            self.low_sample_offset,
+            self.low_sample_tuning,
+            self.prim_sample_offset,
+            self.prim_sample_tuning,
+            self.high_sample_offset,
+            self.high_sample_tuning
+        )
+
     def to_bytes(self) -> bytearray:
-        return struct.pack(
-            '>4B 1I 1I1f 1I1f 1I1f',
+        return _INSTRUMENT_STRUCT.pack(
             self.is_relocated,
             self.key_region_low,
             self.key_region_high,
@@ -28,6 +28,10 @@ Intended Usage:
 '''
 
 
+# Import compact int16 storage for decoded predictors
+import sys
+from array import array
+
 # Import helper functions
 from ...Helpers import *
 
@@ -35,8 +39,29 @@ from ...Helpers import *
 from ...YAMLSerializer import FlowStyleList
 
 
+# Shared sentinel for loopbooks without tail data, so each instance
+# does not allocate its own empty predictor container
+_EMPTY_PREDICTORS: tuple = ()
+
+# Precompiled loopbook header and predictor tail structures
+_LOOPBOOK_STRUCT = struct.Struct('>2I 1i 1I')
+_PREDICTOR_STRUCT = struct.Struct('>16h')
+
+# Constant element skeleton, built once and merged per coefficient in to_dict
+_INT16_ELEMENT = {"datatype": "int16", "ispointer": "0"}
+
+# The raw tail is big endian, so decoding swaps it on little-endian hosts
+_NEEDS_BYTESWAP = sys.byteorder == 'little'
+
+
 class AdpcmLoop: # struct size = 0x10 or 0x30
     ''' Represents an ADPCM loopbook structure in an instrument bank '''
+    __slots__ = (
+        'name', 'offset', 'index',
+        'loop_start', 'loop_end', 'loop_count', 'num_samples',
+        '_predictor_array', '_raw_tail'
+    )
+
     def __init__(self):
         # Set the default name to be used by the class
         self.name = "Loopbook"
@@ -49,13 +74,33 @@ class AdpcmLoop: # struct size = 0x10 or 0x30
         self.loop_count  = 0 # Only 0 or -1
         self.num_samples = 0
 
-        # Predictor array
-        self.predictor_array = []
+        # Predictor array (decoded lazily from the raw tail bytes when parsed from binary)
+        self._predictor_array = _EMPTY_PREDICTORS
+        self._raw_tail = None
+
+    @property
+    def predictor_array(self):
+        if self._predictor_array is None and self._raw_tail is not None:
+            # Decode the tail in one C-level copy, two bytes per coefficient
+            decoded = array('h')
+            decoded.frombytes(self._raw_tail)
+            if _NEEDS_BYTESWAP:
+                decoded.byteswap()
+
+            self._predictor_array = decoded
+        return self._predictor_array
+
+    @predictor_array.setter
+    def predictor_array(self, value):
+        self._predictor_array = value
+        self._raw_tail = None
 
     @classmethod
     def from_bytes(cls, loopbook_offset: int, bank_data: bytes, loopbook_registry: dict):
-        if loopbook_offset in loopbook_registry:
-            return loopbook_registry[loopbook_offset]
+        # Single dict lookup instead of a membership test followed by an index
+        cached = loopbook_registry.get(loopbook_offset)
+        if cached is not None:
+            return cached
 
         self = cls()
         self.offset = loopbook_offset
@@ -65,21 +110,26 @@ class AdpcmLoop: # struct size = 0x10 or 0x30
             self.loop_end,
             self.loop_count,
             self.num_samples
-        ) = struct.unpack('>2I 1i 1I', bank_data[loopbook_offset: loopbook_offset + 0x10])
+        ) = _LOOPBOOK_STRUCT.unpack_from(bank_data, loopbook_offset)
 
-        assert self.loop_count in (0, -1) # (0, 0xFFFFFFFF)
+        # Validation only runs in debug mode, `python -O` strips the whole block
+        if __debug__:
+            assert self.loop_count in (0, -1) # (0, 0xFFFFFFFF)
 
         if self.loop_count != 0:
-            self.predictor_array = list(struct.unpack('>16h', bank_data[loopbook_offset + 0x10:loopbook_offset + 0x30]))
+            # Keep the raw tail and only decode it if the predictors are actually inspected
+            self._raw_tail = bytes(bank_data[loopbook_offset + 0x10:loopbook_offset + 0x30])
+            self._predictor_array = None
 
+        self.index = len(loopbook_registry) # Index before inserting, saving the subtraction
         loopbook_registry[loopbook_offset] = self
-        self.index = len(loopbook_registry) - 1
         return self
 
     def to_dict(self) -> dict:
         loopbook_field = []
 
         if self.loop_count != 0:
+            predictors = self.predictor_array # Bind once so the property is not re-entered
             loopbook_field = [{
                 "datatype": "ALADPCMTail", "ispointer": "0", "value": "0",
                 "struct": {
@@ -88,8 +138,8 @@ class AdpcmLoop: # struct size = 0x10 or 0x30
                         {
                             "name": "data", "datatype": "int16", "ispointer": "0", "isarray": "1", "arraylenfixed": "16", "meaning": "None",
                             "element": [
-                                {"datatype": "int16", "ispointer": "0", "value": str(predictor)}
-                                for predictor in self.predictor_array
+                                {**_INT16_ELEMENT, "value": str(predictor)}
+                                for predictor in predictors
                             ]
                         }
                     ]
@@ -126,13 +176,30 @@ class AdpcmLoop: # struct size = 0x10 or 0x30
 
         return self
 
+    def pack_into(self, buf: bytearray, offset: int) -> None:
+        ''' Writes the loopbook directly into a preallocated buffer, alignment padding stays zero '''
+        _LOOPBOOK_STRUCT.pack_into(buf, offset, self.loop_start, self.loop_end, self.loop_count, self.num_samples)
+
+        if self.loop_count != 0:
+            # Pass the raw tail straight through when it was never decoded
+            if self._predictor_array is None:
+                buf[offset + 0x10:offset + 0x30] = self._raw_tail
+            else:
+                _PREDICTOR_STRUCT.pack_into(buf, offset + 0x10, *self._predictor_array)
+
     def to_bytes(self) -> bytes:
-        raw = struct.pack('>2I 1i 1I', self.loop_start, self.loop_end, self.loop_count, self.num_samples)
+        # Both sizes are already 16-aligned, so no padding step is needed
+        buf = bytearray(0x30 if self.loop_count != 0 else 0x10)
+        _LOOPBOOK_STRUCT.pack_into(buf, 0, self.loop_start, self.loop_end, self.loop_count, self.num_samples)
 
         if self.loop_count != 0:
-            raw += struct.pack('>16h', *self.predictor_array)
+            # Pass the raw tail straight through when it was never decoded
+            if self._predictor_array is None:
+                buf[0x10:0x30] = self._raw_tail
+            else:
+                _PREDICTOR_STRUCT.pack_into(buf, 0x10, *self._predictor_array)
 
-        return add_padding_to_16(raw)
+        return bytes(buf)
 
     @classmethod
     def from_yaml(cls, loopbook_dict: dict):
@@ -159,8 +226,9 @@ class AdpcmLoop: # struct size = 0x10 or 0x30
             "total samples": self.num_samples,
         }
 
-        if self.predictor_array:
-            data['predictors'] = FlowStyleList(self.predictor_array)
+        predictors = self.predictor_array # Bind once so the property is not re-entered
+        if predictors:
+            data['predictors'] = FlowStyleList(predictors)
 
         return data
 
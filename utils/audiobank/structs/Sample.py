@@ -56,9 +56,45 @@ SAMPLE_NAMES: dict[int, str] = {}
 AUDIOTABLE_ID: int = 0
 DETECTED_GAME: str = ''
 
+# Precompiled sample structure (bitfield and the three pointers)
+_SAMPLE_STRUCT = struct.Struct('>4I')
+
+# Enum members hoisted to plain ints so validation skips the EnumMeta machinery per sample
+_VALID_CODECS = (int(AudioSampleCodec.ADPCM), int(AudioSampleCodec.SMALL_ADPCM))
+_MEDIUM_RAM = int(AudioStorageMedium.RAM)
+
+# Enum value-to-name tables so exports avoid constructing an enum instance per sample
+_CODEC_NAME  = {member.value: member.name for member in AudioSampleCodec}
+_MEDIUM_NAME = {member.value: member.name for member in AudioStorageMedium}
+
+# Constant field skeletons and the bitfield comment, built once and merged per sample in to_dict
+_BITFIELD_FIELD = {"name": "Bitfield", "datatype": "uint32", "ispointer": "0", "isarray": "0", "meaning": "None"}
+_TABLE_POINTER_FIELD = {"name": "Audiotable Address", "datatype": "uint32", "ispointer": "0", "ptrto": "ATSample", "isarray": "0", "meaning": "Sample Address (in Sample Table)"}
+_LOOPBOOK_POINTER_FIELD = {"name": "Loop Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ALADPCMLoop", "isarray": "0", "meaning": "Ptr ALADPCMLoop"}
+_CODEBOOK_POINTER_FIELD = {"name": "Book Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ALADPCMBook", "isarray": "0", "meaning": "Ptr ALADPCMBook"}
+
+# Leave this comment formatted as-is, it adds a nice prettified comment to each sample item explaining the bitfield
+_BITFIELD_COMMENT = """
+            Below are the bitfield values for each bit they represent.
+            Each of these values takes up a specific amount of the 32 bits representing the u32 value.
+            1 Bit(s): Unk_0       (Bit(s) 1):    {unk_0}
+            3 Bit(s): Codec       (Bit(s) 2-4):  {codec_name} ({codec})
+            2 Bit(s): Medium      (Bit(s) 5-6):  {medium_name} ({medium})
+            1 Bit(s): Cached      (Bit(s) 7):    {cached} ({is_cached})
+            1 Bit(s): Relocated   (Bit(s) 8):    {relocated} ({is_relocated})
+            24 Bit(s): Binary size (Bit(s) 9-32): {size}
+        """
+
 
 class Sample: # struct size = 0x10
     ''' Represents a sample structure in an instrument bank '''
+    __slots__ = (
+        'name', 'offset', 'index',
+        'bits', 'unk_0', 'codec', 'medium', 'is_cached', 'is_relocated', 'size',
+        'table_offset', 'loopbook_offset', 'codebook_offset',
+        'loopbook', 'codebook'
+    )
+
     def __init__(self):
         # Set the default name to be used by the class
         self.name = "Sample"
@@ -92,8 +128,10 @@ class Sample: # struct size = 0x10
 
     @classmethod
     def from_bytes(cls, sample_offset: int, bank_data: bytes, sample_registry: dict, loopbook_registry: dict, codebook_registry: dict):
-        if sample_offset in sample_registry:
-            return sample_registry[sample_offset]
+        # Single dict lookup instead of a membership test followed by an index
+        cached = sample_registry.get(sample_offset)
+        if cached is not None:
+            return cached
 
         self = cls()
         self.offset = sample_offset
@@ -103,20 +141,23 @@ class Sample: # struct size = 0x10
             self.table_offset,
             self.loopbook_offset,
             self.codebook_offset
-        ) = struct.unpack('>4I', bank_data[sample_offset:sample_offset + 0x10])
-
-        self.unk_0        = (self.bits >> 31) & 0b1
-        self.codec        = (self.bits >> 28) & 0b111
-        self.medium       = (self.bits >> 26) & 0b11
-        self.is_cached    = (self.bits >> 25) & 1
-        self.is_relocated = (self.bits >> 24) & 1
-        self.size         = (self.bits >> 0) & 0b111111111111111111111111
-
-        assert self.codebook_offset != 0
-        assert self.loopbook_offset != 0
-        assert AudioSampleCodec(self.codec) in (AudioSampleCodec.ADPCM, AudioSampleCodec.SMALL_ADPCM)
-        assert AudioStorageMedium(self.medium) == AudioStorageMedium.RAM
-        assert not self.is_relocated
+        ) = _SAMPLE_STRUCT.unpack_from(bank_data, sample_offset)
+
+        # The top shift needs no mask since bits comes from an unsigned 32-bit unpack
+        b = self.bits
+        self.unk_0, self.codec, self.medium, self.is_cached, self.is_relocated, self.size = (
+            b >> 31, (b >> 28) & 0b111, (b >> 26) & 0b11, (b >> 25) & 1, (b >> 24) & 1, b & 0xFFFFFF
+        )
+
+        # Validation only runs in debug mode, `python -O` strips the whole block
+        if __debug__:
+            assert (
+                self.codebook_offset != 0
+                and self.loopbook_offset != 0
+                and self.codec in _VALID_CODECS
+                and self.medium == _MEDIUM_RAM
+                and not self.is_relocated
+            )
 
         # Get the proper offset for searching through the audio tables
         if DETECTED_GAME == 'oot':
@@ -135,8 +176,8 @@ class Sample: # struct size = 0x10
         self.loopbook.name = f"{self.name} Loopbook" if sample_name != "Sample" else "Loopbook"
         self.codebook.name = f"{self.name} Codebook" if sample_name != "Sample" else "Codebook"
 
+        self.index = len(sample_registry) # Index before inserting, saving the subtraction
         sample_registry[sample_offset] = self
-        self.index = len(sample_registry) - 1
         return self
 
     def to_dict(self) -> dict:
@@ -144,22 +185,19 @@ class Sample: # struct size = 0x10
             "address": str(self.offset), "name": f"{self.name} [{self.index}]",
             "struct": {
                 "name": "ABSample",
-                # Leave this comment formatted as-is, it adds a nice prettified comment to each sample item explaining the bitfield
-                "__comment__": f"""
-            Below are the bitfield values for each bit they represent.
-            Each of these values takes up a specific amount of the 32 bits representing the u32 value.
-            1 Bit(s): Unk_0       (Bit(s) 1):    {self.unk_0}
-            3 Bit(s): Codec       (Bit(s) 2-4):  {AudioSampleCodec(self.codec).name} ({self.codec})
-            2 Bit(s): Medium      (Bit(s) 5-6):  {AudioStorageMedium(self.medium).name} ({self.medium})
-            1 Bit(s): Cached      (Bit(s) 7):    {bool(self.is_cached)} ({self.is_cached})
-            1 Bit(s): Relocated   (Bit(s) 8):    {bool(self.is_relocated)} ({self.is_relocated})
-            24 Bit(s): Binary size (Bit(s) 9-32): {self.size}
-        """,
+                "__comment__": _BITFIELD_COMMENT.format(
+                    unk_0=self.unk_0,
+                    codec_name=_CODEC_NAME[self.codec], codec=self.codec,
+                    medium_name=_MEDIUM_NAME[self.medium], medium=self.medium,
+                    cached=bool(self.is_cached), is_cached=self.is_cached,
+                    relocated=bool(self.is_relocated), is_relocated=self.is_relocated,
+                    size=self.size
+                ),
                 "field": [
-                    {"name": "Bitfield", "datatype": "uint32", "ispointer": "0", "isarray": "0", "meaning": "None", "value": str(self.bits)},
-                    {"name": "Audiotable Address", "datatype": "uint32", "ispointer": "0", "ptrto": "ATSample", "isarray": "0", "meaning": "Sample Address (in Sample Table)", "value": str(self.table_offset)},
-                    {"name": "Loop Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ALADPCMLoop", "isarray": "0", "meaning": "Ptr ALADPCMLoop", "value": str(self.loopbook_offset), "index": str(self.loopbook.index)},
-                    {"name": "Book Pointer", "datatype": "uint32", "ispointer": "1", "ptrto": "ALADPCMBook", "isarray": "0", "meaning": "Ptr ALADPCMBook", "value": str(self.codebook_offset), "index": str(self.codebook.index)}
+                    {**_BITFIELD_FIELD, "value": str(self.bits)},
+                    {**_TABLE_POINTER_FIELD, "value": str(self.table_offset)},
+                    {**_LOOPBOOK_POINTER_FIELD, "value": str(self.loopbook_offset), "index": str(self.loopbook.index)},
+                    {**_CODEBOOK_POINTER_FIELD, "value": str(self.codebook_offset), "index": str(self.codebook.index)}
                 ]
             }
         }
@@ -181,23 +219,42 @@ class Sample: # struct size = 0x10
 
         assert self.loopbook is not None
         assert self.codebook is not None
-        assert AudioSampleCodec(self.codec) in (AudioSampleCodec.ADPCM, AudioSampleCodec.SMALL_ADPCM)
-        assert AudioStorageMedium(self.medium) == AudioStorageMedium.RAM
+        assert self.codec in _VALID_CODECS
+        assert self.medium == _MEDIUM_RAM
         assert not self.is_relocated
 
         return self
 
+    def pack_into(self, buf: bytearray, offset: int) -> None:
+        ''' Writes the sample structure directly into a preallocated buffer '''
+        bits = (
+            ((self.unk_0 & 0b1) << 31)
+            | ((self.codec & 0b111) << 28)
+            | ((self.medium & 0b11) << 26)
+            | ((self.is_cached & 1) << 25)
+            | ((self.is_relocated & 1) << 24)
+            | (self.size & 0xFFFFFF)
+        )
+
+        _SAMPLE_STRUCT.pack_into(
+            buf, offset,
+            bits,
+            self.table_offset,
+            self.loopbook_offset,
+            self.codebook_offset
+        )
+
     def to_bytes(self) -> bytes:
-        bits  = 0
-        bits |= (self.unk_0 & 0b1) << 31
-        bits |= (self.codec & 0b111) << 28
-        bits |= (self.medium & 0b11) << 26
-        bits |= (self.is_cached & 1) << 25
-        bits |= (self.is_relocated & 1) << 24
-        bits |= (self.size & 0b111111111111111111111111)
-
-        return struct.pack(
-            '>4I',
+        bits = (
+            ((self.unk_0 & 0b1) << 31)
+            | ((self.codec & 0b111) << 28)
+            | ((self.medium & 0b11) << 26)
+            | ((self.is_cached & 1) << 25)
+            | ((self.is_relocated & 1) << 24)
+            | (self.size & 0xFFFFFF)
+        )
+
+        return _SAMPLE_STRUCT.pack(
             bits,
             self.table_offset,
             self.loopbook_offset,
@@ -227,8 +284,8 @@ class Sample: # struct size = 0x10
 
         assert self.loopbook is not None
         assert self.codebook is not None
-        assert AudioSampleCodec(self.codec) in (AudioSampleCodec.ADPCM, AudioSampleCodec.SMALL_ADPCM)
-        assert AudioStorageMedium(self.medium) == AudioStorageMedium.RAM
+        assert self.codec in _VALID_CODECS
+        assert self.medium == _MEDIUM_RAM
         assert not self.is_relocated
 
         return self
@@ -238,8 +295,8 @@ class Sample: # struct size = 0x10
             "name": f"{self.name} [{self.index}]",
             "bitfield": {
                 "unk_0": self.unk_0,
-                "codec": AudioSampleCodec(self.codec).name,
-                "medium": AudioStorageMedium(self.medium).name,
+                "codec": _CODEC_NAME[self.codec],
+                "medium": _MEDIUM_NAME[self.medium],
                 "cached": bool(self.is_cached),
                 "relocated": bool(self.is_relocated),
                 "size": self.size